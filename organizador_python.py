@@ -1,6 +1,102 @@
+import argparse
+import errno
+import logging
 import os
+import re
 import shutil
+import sys
+from bisect import bisect_right
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from pathlib import Path
+from types import MappingProxyType
+
+try:
+    import ahocorasick  # pyahocorasick (opcional): acelera la búsqueda de palabras clave
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan  # hyperscan (opcional): búsqueda multipatrón con SIMD, aún más rápida
+except ImportError:
+    hyperscan = None
+
+logger = logging.getLogger(__name__)
+
+# Separador usado al buscar palabras clave en varios nombres a la vez:
+# ningún nombre de archivo puede contenerlo
+SEPARADOR = "/"
+
+# ===== CONFIGURACIÓN =====
+# Cambia esta ruta a la carpeta donde tienes tus archivos
+CARPETA_ORIGEN = "."  # "." significa la carpeta actual
+
+# Define tus materias con palabras clave para identificarlas
+# Formato: "Nombre Materia": ["palabra1", "palabra2", "palabra3"]
+MATERIAS_PALABRAS_CLAVE = MappingProxyType({
+    materia: frozenset(palabra.lower() for palabra in palabras_clave)
+    for materia, palabras_clave in {
+        "Base de Datos": [
+            "base", "datos", "basedatos", "bd", "postgresql", 
+            "postgres", "sql", "vistas", "auditoria", "modelo conceptual", 
+            "modelo", "actividad_clase", "BD"
+        ],
+        "Estructura de Datos": [
+            "tad", "pila", "cola", "colas", "arboles", "caratula", "ej", "EJ", "ver", "veterinaria"
+        ],
+        "Modelado Orientado a Objetos": [
+            "modelado", "objetos", "moo", "uml", "diagrama",
+            "secuencia", "clases", "argouml", "refactorizacion", 
+            "ejercicio", "escuela", "scar", "addons"
+        ],
+        "Perspectiva de la Inteligencia Artificial": [
+            "ia", "inteligencia", "artificial", "perspectiva",
+            "robotica", "vision", "sesgos", "discriminacion",
+            "etica", "responsabilidad", "logica difusa", "tendencias",
+            "trabajo-autonomo", "difusa", "ia", "Uleam"
+        ],
+        "Programacion Estructurada": [
+            "programacion", "estructurada", "funciones",
+            "ciclos", "diccionarios", "numpy", "archivos", "manipulacion", 
+            "actividad_en_clase", "actv", "hay q hacer", "ejercicio", "numeros", "multiplos", "escoger", "retorno",
+            "precios", "planificacion", "vector", "validar", "empleados", "promedio", "cedu","programacion"
+        ],
+        "Redes de la computadora": [
+            "redes", "red", "wan", "vpn", "ethernet", "fibra",
+            "optica", "packet tracer", "subnectic", "acls", "ieee","packet", "MAC"
+        ]
+    }.items()
+})
+
+# Define qué carpetas crear para cada materia
+# Si no especificas una materia, usará la estructura por defecto: pdf, words, powerpoint
+ESTRUCTURA_PERSONALIZADA = MappingProxyType({
+    materia: tuple(carpetas)
+    for materia, carpetas in {
+        "Modelado Orientado a Objetos": [
+            "pdf", "words", "powerpoint", "imagenes", "diagramas"
+        ],
+        "Perspectiva de la Inteligencia Artificial": [
+            "pdf", "words", "powerpoint", "imagenes", "comprimidos"
+        ],
+        "Programacion Estructurada": [
+            "pdf", "words", "powerpoint","comprimidos", "codigo"
+        ],
+        "Estructura de Datos": [
+            "pdf", "words", "powerpoint", "codigos"
+        ],
+        "Redes de la computadora": [
+            "pdf", "words", "powerpoint"
+        ],
+        "Base de Datos": [
+            "pdf", "words", "powerpoint", "comprimidos"
+        ]
+        # Las demás materias usarán la estructura por defecto
+    }.items()
+})
+# =========================
+
 
 class OrganizadorArchivos:
     def __init__(self, carpeta_origen, materias_con_palabras_clave, estructura_personalizada=None):
@@ -17,6 +113,16 @@ class OrganizadorArchivos:
         self.materias_palabras_clave = materias_con_palabras_clave
         self.estructura_personalizada = estructura_personalizada or {}
         
+        # Materias en orden de prioridad (si varias coinciden, gana la primera)
+        self._materias = list(materias_con_palabras_clave)
+        self._materias_set = frozenset(self._materias)
+        self._materias_palabras_lc = {
+            materia: tuple(palabra.lower() for palabra in palabras_clave)
+            for materia, palabras_clave in materias_con_palabras_clave.items()
+        }
+        self._hs = self._construir_base_hyperscan()
+        self._ac = None if self._hs is not None else self._construir_automata()
+        
         # Extensiones por tipo de archivo
         self.tipos_archivos = {
             'pdf': ['.pdf'],
@@ -30,6 +136,65 @@ class OrganizadorArchivos:
         
         # Estructura por defecto (se usa si no se especifica una personalizada)
         self.estructura_default = ['pdf', 'words', 'powerpoint']
+        
+        # Índices precalculados: extensión -> tipo y materia -> tipos permitidos
+        self._ext_to_tipo = {}
+        for tipo, extensiones in self.tipos_archivos.items():
+            for ext in extensiones:
+                self._ext_to_tipo.setdefault(ext, tipo)
+        self._carpetas_por_materia = {
+            materia: set(self.obtener_carpetas_para_materia(materia))
+            for materia in self._materias
+        }
+    
+    def _construir_automata(self):
+        """
+        Compila todas las palabras clave en un autómata Aho-Corasick.
+        
+        Returns:
+            Autómata que asocia cada palabra clave (en minúsculas) con el índice
+            de su materia, o None si pyahocorasick no está instalado
+        """
+        if ahocorasick is None:
+            return None
+        
+        automata = ahocorasick.Automaton()
+        for indice, palabras_clave in enumerate(self._materias_palabras_lc.values()):
+            for palabra in palabras_clave:
+                # Una palabra repetida en varias materias se queda con la primera;
+                # las que contienen el separador nunca pueden aparecer en un nombre
+                if palabra and SEPARADOR not in palabra and palabra not in automata:
+                    automata.add_word(palabra, indice)
+        
+        if len(automata) == 0:
+            return None
+        automata.make_automaton()
+        return automata
+    
+    def _construir_base_hyperscan(self):
+        """
+        Compila todas las palabras clave en una base de datos de hyperscan.
+        
+        Returns:
+            Base compilada cuyos ids son el índice de la materia de cada
+            palabra clave, o None si hyperscan no está instalado
+        """
+        if hyperscan is None:
+            return None
+        
+        expresiones = []
+        ids = []
+        for indice, palabras_clave in enumerate(self._materias_palabras_lc.values()):
+            for palabra in palabras_clave:
+                if palabra and SEPARADOR not in palabra:
+                    expresiones.append(re.escape(palabra).encode('utf-8'))
+                    ids.append(indice)
+        
+        if not expresiones:
+            return None
+        base = hyperscan.Database()
+        base.compile(expressions=expresiones, ids=ids, elements=len(expresiones))
+        return base
     
     def obtener_carpetas_para_materia(self, materia):
         """
@@ -47,79 +212,240 @@ class OrganizadorArchivos:
     
     def crear_estructura_carpetas(self):
         """Crea la estructura de carpetas para cada materia"""
-        print("Creando estructura de carpetas...")
+        logger.info("Creando estructura de carpetas...")
+        detalle = logger.isEnabledFor(logging.INFO)
+        lineas = []
         
-        for materia in self.materias_palabras_clave.keys():
-            carpeta_materia = self.carpeta_origen / materia
-            carpeta_materia.mkdir(exist_ok=True)
-            
+        # Reunir primero las carpetas hoja sin repetir (ruta -> nombre a mostrar);
+        # makedirs crea también la carpeta de la materia en la misma llamada
+        origen = str(self.carpeta_origen)
+        hojas = {}
+        for materia in self._materias:
             # Obtener carpetas específicas para esta materia
             carpetas_materia = self.obtener_carpetas_para_materia(materia)
-            
-            # Crear subcarpetas solo las especificadas
+            if not carpetas_materia:
+                hojas.setdefault(os.path.join(origen, materia), None)
             for tipo in carpetas_materia:
-                carpeta_tipo = carpeta_materia / tipo
-                carpeta_tipo.mkdir(exist_ok=True)
-                print(f"  ✓ Creada: {carpeta_materia.name}/{tipo}")
+                hojas.setdefault(os.path.join(origen, materia, tipo), f"{materia}/{tipo}")
+        
+        for carpeta, nombre in hojas.items():
+            os.makedirs(carpeta, exist_ok=True)
+            if detalle and nombre:
+                lineas.append(f"  ✓ Creada: {nombre}")
+        
+        # Un solo mensaje por fase en lugar de uno por carpeta
+        if lineas:
+            logger.info("\n".join(lineas))
+    
+    def _recorrer(self, carpeta):
+        """
+        Recorre recursivamente una carpeta usando os.scandir, sin entrar
+        en las carpetas de materias (su contenido ya está organizado).
+        
+        Args:
+            carpeta: Ruta de la carpeta a recorrer
+            
+        Yields:
+            Tuplas (ruta, es_carpeta, es_archivo) para cada entrada. es_carpeta no
+            sigue enlaces simbólicos (no se entra en ellos); es_archivo sí, como
+            Path.is_file, así que enlaces a carpetas, enlaces rotos, FIFOs, etc.
+            no cuentan como archivos
+        """
+        try:
+            with os.scandir(carpeta) as entradas:
+                for entrada in entradas:
+                    es_carpeta = entrada.is_dir(follow_symlinks=False)
+                    if es_carpeta and entrada.name in self._materias_set:
+                        continue
+                    yield entrada.path, es_carpeta, not es_carpeta and entrada.is_file()
+                    if es_carpeta:
+                        yield from self._recorrer(entrada.path)
+        except OSError as e:
+            # Como rglob: una carpeta que no se puede leer se omite y se sigue
+            # con el resto (las subcarpetas ya fallan dentro de su propia llamada)
+            logger.warning("  ⚠ No se pudo leer %s: %s", os.path.relpath(carpeta, self.carpeta_origen), e)
+    
+    def _mover_rapido(self, ruta, destino):
+        """
+        Mueve un archivo con un simple rename cuando origen y destino están
+        en el mismo sistema de archivos, que es el caso habitual.
+        
+        Args:
+            ruta: Ruta del archivo a mover
+            destino: Ruta final del archivo
+        """
+        try:
+            # os.replace sobrescribe un destino existente en todas las
+            # plataformas, igual que hacía shutil.move (en Windows, cuando
+            # os.rename falla, shutil.move copia encima del destino)
+            os.replace(ruta, destino)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            # Distinto sistema de archivos: copiar y borrar
+            if hasattr(os, 'copy_file_range') and not os.path.islink(ruta):
+                try:
+                    self._copiar_en_kernel(ruta, destino)
+                except OSError:
+                    # Kernels antiguos no copian entre sistemas de archivos; si la
+                    # copia falló a medias (ENOSPC, EIO) no dejar un archivo truncado
+                    with suppress(FileNotFoundError):
+                        os.unlink(destino)
+                    shutil.move(ruta, destino)
+                else:
+                    os.unlink(ruta)
+            else:
+                shutil.move(ruta, destino)
+    
+    def _copiar_en_kernel(self, ruta, destino):
+        """
+        Copia un archivo con os.copy_file_range (Linux), de modo que los datos
+        no pasan por Python; en Btrfs/XFS el kernel puede incluso compartir
+        los bloques en lugar de copiarlos.
+        
+        Args:
+            ruta: Ruta del archivo a copiar
+            destino: Ruta de la copia
+        """
+        with open(ruta, 'rb') as fuente, open(destino, 'wb') as copia:
+            entrada, salida = fuente.fileno(), copia.fileno()
+            tamano = os.fstat(entrada).st_size
+            copiado = 0
+            while copiado < tamano:
+                bloque = os.copy_file_range(entrada, salida, tamano - copiado)
+                if bloque == 0:
+                    break
+                copiado += bloque
+            # Algunos kernels devuelven 0 sin copiar nada entre sistemas de
+            # archivos: no dar la copia por buena si está incompleta
+            if copiado != tamano:
+                raise OSError(errno.EIO, f"copia incompleta ({copiado} de {tamano} bytes)", destino)
+        # Conservar permisos y fechas, igual que shutil.move
+        shutil.copystat(ruta, destino)
+    
+    def _mover_en_lote(self, movimientos):
+        """
+        Ejecuta un lote de movimientos ya planificados.
+        
+        Args:
+            movimientos: Lista de tuplas (ruta_origen, ruta_destino)
+            
+        Returns:
+            Lista de tuplas (ruta_origen, ruta_destino, error), con error None
+            si el archivo se movió correctamente
+        """
+        if not movimientos:
+            return []
+        
+        def mover(movimiento):
+            ruta, destino = movimiento
+            try:
+                self._mover_rapido(ruta, destino)
+                return ruta, destino, None
+            except Exception as e:
+                return ruta, destino, e
+        
+        # Los movimientos liberan el GIL mientras esperan al disco, así que varios
+        # hilos solapan la E/S; map conserva el orden del lote
+        hilos = min(len(movimientos), (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=hilos) as executor:
+            return list(executor.map(mover, movimientos))
     
     def mover_archivos_de_subcarpetas(self):
         """
         Mueve todos los archivos de subcarpetas a la carpeta principal
         y elimina las carpetas vacías.
+        
+        Returns:
+            Lista con las rutas de los archivos que quedan en la carpeta principal
         """
-        print("\nMoviendo archivos de subcarpetas a la carpeta principal...")
+        logger.info("\nMoviendo archivos de subcarpetas a la carpeta principal...")
+        detalle = logger.isEnabledFor(logging.INFO)
         archivos_movidos = 0
         carpetas_eliminadas = 0
+        origen = str(self.carpeta_origen)
         
-        # Recorrer todas las subcarpetas
-        for item in self.carpeta_origen.rglob('*'):
-            # Solo procesar archivos que están dentro de subcarpetas
-            if item.is_file() and item.parent != self.carpeta_origen:
-                # Saltar archivos que ya están en carpetas de materias organizadas
-                if any(materia in str(item.parent) for materia in self.materias_palabras_clave.keys()):
-                    continue
-                
-                destino = self.carpeta_origen / item.name
-                
-                # Si ya existe un archivo con ese nombre, agregar sufijo
-                if destino.exists():
-                    base = destino.stem
-                    ext = destino.suffix
-                    contador = 1
-                    while destino.exists():
-                        destino = self.carpeta_origen / f"{base}_{contador}{ext}"
-                        contador += 1
-                
-                try:
-                    shutil.move(str(item), str(destino))
-                    print(f"  ✓ Movido: {item.relative_to(self.carpeta_origen)} → {destino.name}")
-                    archivos_movidos += 1
-                except Exception as e:
-                    print(f"  ✗ Error moviendo {item.name}: {e}")
-        
-        # Eliminar carpetas vacías (de abajo hacia arriba)
-        print("\nEliminando carpetas vacías...")
-        for carpeta in sorted(self.carpeta_origen.rglob('*'), key=lambda p: len(p.parts), reverse=True):
-            if carpeta.is_dir() and carpeta != self.carpeta_origen:
-                # No eliminar carpetas de materias
-                if carpeta.name in self.materias_palabras_clave.keys():
-                    continue
-                
-                # No eliminar carpetas de tipos (pdf, words, etc.) dentro de materias
-                if any(materia in str(carpeta.parent) for materia in self.materias_palabras_clave.keys()):
-                    continue
-                
-                try:
-                    # Solo eliminar si está vacía
-                    if not any(carpeta.iterdir()):
-                        carpeta.rmdir()
-                        print(f"  ✓ Eliminada: {carpeta.relative_to(self.carpeta_origen)}")
-                        carpetas_eliminadas += 1
-                except Exception as e:
-                    print(f"  ⚠ No se pudo eliminar {carpeta.name}: {e}")
-        
-        print(f"\n  Archivos movidos: {archivos_movidos}")
-        print(f"  Carpetas eliminadas: {carpetas_eliminadas}")
+        # Listar el nivel superior una sola vez: sirve para entrar en las
+        # subcarpetas, para conocer los nombres ocupados y para la fase siguiente
+        with os.scandir(origen) as entradas:
+            nivel_superior = list(entradas)
+        archivos_principales = [entrada.path for entrada in nivel_superior if not entrada.is_dir()]
+        
+        # Un solo recorrido del árbol: archivos a mover y carpetas encontradas
+        # (las carpetas de materias ni siquiera se recorren). _recorrer omite las
+        # carpetas ilegibles, así que una de ellas no detiene el resto del recorrido
+        archivos_a_mover = []
+        carpetas = []
+        for entrada in nivel_superior:
+            if not entrada.is_dir(follow_symlinks=False) or entrada.name in self._materias_set:
+                continue
+            carpetas.append(entrada.path)
+            for ruta, es_carpeta, es_archivo in self._recorrer(entrada.path):
+                if es_carpeta:
+                    carpetas.append(ruta)
+                elif es_archivo:
+                    archivos_a_mover.append(ruta)
+        
+        # Planificar los destinos antes de mover nada: los nombres ocupados
+        # se consultan en memoria en lugar de preguntar al disco cada vez.
+        # Se comparan sin distinguir mayúsculas, como en Windows y macOS
+        movimientos = []
+        existentes = {entrada.name.casefold() for entrada in nivel_superior}
+        contadores = defaultdict(int)
+        for ruta in archivos_a_mover:
+            nombre = os.path.basename(ruta)
+            
+            # Si ya existe un archivo con ese nombre, agregar sufijo
+            if nombre.casefold() in existentes:
+                base, ext = os.path.splitext(nombre)
+                while nombre.casefold() in existentes:
+                    contadores[(base, ext)] += 1
+                    nombre = f"{base}_{contadores[(base, ext)]}{ext}"
+            
+            existentes.add(nombre.casefold())
+            movimientos.append((ruta, os.path.join(origen, nombre)))
+        
+        # Los errores van en el mismo bloque para conservar el orden de los
+        # archivos; el bloque se emite con el nivel más grave que contenga
+        lineas = []
+        nivel = logging.INFO
+        for ruta, destino, error in self._mover_en_lote(movimientos):
+            if error is None:
+                if detalle:
+                    lineas.append(f"  ✓ Movido: {os.path.relpath(ruta, origen)} → {os.path.basename(destino)}")
+                archivos_principales.append(destino)
+                archivos_movidos += 1
+            else:
+                lineas.append(f"  ✗ Error moviendo {os.path.basename(ruta)}: {error}")
+                nivel = logging.ERROR
+        if lineas:
+            logger.log(nivel, "\n".join(lineas))
+        
+        # Eliminar carpetas vacías (de abajo hacia arriba: el recorrido
+        # visita cada carpeta antes que su contenido, así que basta invertirlo)
+        logger.info("\nEliminando carpetas vacías...")
+        # Las carpetas de materias y sus tipos (pdf, words, etc.) no se recorren,
+        # así que nunca llegan aquí
+        lineas = []
+        nivel = logging.INFO
+        for carpeta in reversed(carpetas):
+            try:
+                # rmdir solo elimina carpetas vacías: no hace falta listarlas antes
+                os.rmdir(carpeta)
+                if detalle:
+                    lineas.append(f"  ✓ Eliminada: {os.path.relpath(carpeta, origen)}")
+                carpetas_eliminadas += 1
+            except OSError as e:
+                if e.errno not in (errno.ENOTEMPTY, errno.EEXIST):
+                    lineas.append(f"  ⚠ No se pudo eliminar {os.path.basename(carpeta)}: {e}")
+                    nivel = logging.WARNING
+        if lineas:
+            logger.log(nivel, "\n".join(lineas))
+        
+        logger.info("\n  Archivos movidos: %d", archivos_movidos)
+        logger.info("  Carpetas eliminadas: %d", carpetas_eliminadas)
+        
+        return archivos_principales
     
     def identificar_materia(self, nombre_archivo):
         """
@@ -131,16 +457,69 @@ class OrganizadorArchivos:
         Returns:
             Nombre de la materia o None si no se identifica
         """
+        if self._hs is not None or self._ac is not None:
+            return self.identificar_materias([nombre_archivo])[0]
+        
         nombre_lower = nombre_archivo.lower()
         
         # Buscar en cada materia si alguna palabra clave coincide
-        for materia, palabras_clave in self.materias_palabras_clave.items():
+        for materia, palabras_clave in self._materias_palabras_lc.items():
             for palabra in palabras_clave:
-                if palabra.lower() in nombre_lower:
+                if palabra in nombre_lower:
                     return materia
         
         return None
     
+    def identificar_materias(self, nombres_archivos):
+        """
+        Identifica la materia de varios archivos a la vez.
+        
+        Con hyperscan o Aho-Corasick todos los nombres se unen con SEPARADOR
+        y se recorren en una sola llamada, en lugar de una por archivo.
+        
+        Args:
+            nombres_archivos: Lista de nombres de archivo
+            
+        Returns:
+            Lista con la materia (o None) de cada archivo, en el mismo orden
+        """
+        if self._hs is None and self._ac is None:
+            return [self.identificar_materia(nombre) for nombre in nombres_archivos]
+        if not nombres_archivos:
+            return []
+        
+        partes = [nombre.lower() for nombre in nombres_archivos]
+        if self._hs is not None:
+            partes = [parte.encode('utf-8') for parte in partes]
+        
+        # Posición donde empieza cada nombre dentro del texto unido
+        inicios = []
+        posicion = 0
+        for parte in partes:
+            inicios.append(posicion)
+            posicion += len(parte) + 1
+        
+        # Entre todas las coincidencias de un nombre gana la materia declarada
+        # primero, igual que en la búsqueda lineal
+        mejores = [None] * len(partes)
+        
+        def registrar(ultimo, indice):
+            # ultimo: posición del último carácter de la coincidencia
+            i = bisect_right(inicios, ultimo) - 1
+            if mejores[i] is None or indice < mejores[i]:
+                mejores[i] = indice
+        
+        if self._hs is not None:
+            self._hs.scan(
+                SEPARADOR.encode('utf-8').join(partes),
+                match_event_handler=lambda indice, inicio, fin, flags, contexto: registrar(fin - 1, indice)
+            )
+        else:
+            for ultimo, indice in self._ac.iter(SEPARADOR.join(partes)):
+                registrar(ultimo, indice)
+        
+        return [None if i is None else self._materias[i] for i in mejores]
+    
     def obtener_tipo_archivo(self, extension):
         """
         Determina el tipo de archivo según su extensión.
@@ -151,150 +530,129 @@ class OrganizadorArchivos:
         Returns:
             Tipo de archivo o None si no se reconoce
         """
-        for tipo, extensiones in self.tipos_archivos.items():
-            if extension.lower() in extensiones:
-                return tipo
-        return None
+        return self._ext_to_tipo.get(extension.lower())
     
-    def organizar_archivos(self, mover_de_subcarpetas=True, crear_estructura=True):
+    def organizar_archivos(self, mover_de_subcarpetas=True, crear_estructura=False):
         """
         Organiza todos los archivos en sus carpetas correspondientes.
         
+        Las carpetas materia/tipo se crean a medida que hacen falta, así que
+        solo aparecen las que reciben algún archivo.
+        
         Args:
             mover_de_subcarpetas: Si True, primero mueve archivos de subcarpetas
-            crear_estructura: Si True, crea la estructura de carpetas primero
+            crear_estructura: Si True, crea primero toda la estructura de carpetas,
+                              incluidas las que queden vacías
         """
-        # Paso 1: Mover archivos de subcarpetas si se solicita
+        # Paso 1: Mover archivos de subcarpetas si se solicita; en ambos casos
+        # se obtienen los archivos del nivel superior sin volver a listarlo
         if mover_de_subcarpetas:
-            self.mover_archivos_de_subcarpetas()
+            archivos = self.mover_archivos_de_subcarpetas()
+        else:
+            with os.scandir(self.carpeta_origen) as entradas:
+                archivos = [entrada.path for entrada in entradas if not entrada.is_dir()]
         
         # Paso 2: Crear estructura de carpetas
         if crear_estructura:
             self.crear_estructura_carpetas()
         
-        print("\nOrganizando archivos...")
+        logger.info("\nOrganizando archivos...")
+        detalle = logger.isEnabledFor(logging.INFO)
         archivos_organizados = 0
         archivos_no_organizados = []
+        # Mensajes en orden de archivo; los errores suben el nivel del bloque
+        lineas = []
+        nivel = logging.INFO
         
-        # Recorrer todos los archivos en la carpeta origen (solo nivel superior)
-        for archivo in self.carpeta_origen.iterdir():
-            # Saltar si es una carpeta
-            if archivo.is_dir():
-                continue
-            
+        movimientos = []
+        etiquetas = []
+        origen = str(self.carpeta_origen)
+        # (materia, tipo) -> ruta de la carpeta destino, ya creada en disco
+        carpetas_destino = {}
+        
+        # Identificar las materias de todos los archivos de una vez
+        nombres = [os.path.basename(archivo) for archivo in archivos]
+        materias = self.identificar_materias(nombres)
+        
+        for archivo, nombre_archivo, materia in zip(archivos, nombres, materias):
             # Obtener información del archivo
-            nombre_archivo = archivo.name
-            extension = archivo.suffix
+            extension = os.path.splitext(nombre_archivo)[1]
             
-            # Identificar materia y tipo
-            materia = self.identificar_materia(nombre_archivo)
+            # Identificar tipo
             tipo = self.obtener_tipo_archivo(extension)
             
             if materia and tipo:
                 # Verificar si esta materia debe tener este tipo de carpeta
-                carpetas_materia = self.obtener_carpetas_para_materia(materia)
-                
-                if tipo in carpetas_materia:
-                    # Construir ruta de destino
-                    carpeta_destino = self.carpeta_origen / materia / tipo
-                    ruta_destino = carpeta_destino / nombre_archivo
+                if tipo in self._carpetas_por_materia[materia]:
+                    # Crear la carpeta la primera vez que se necesita
+                    carpeta_destino = carpetas_destino.get((materia, tipo))
+                    if carpeta_destino is None:
+                        carpeta_destino = os.path.join(origen, materia, tipo)
+                        try:
+                            os.makedirs(carpeta_destino, exist_ok=True)
+                        except Exception as e:
+                            lineas.append(f"  ✗ Error creando {materia}/{tipo}: {e}")
+                            nivel = logging.ERROR
+                            archivos_no_organizados.append(nombre_archivo)
+                            continue
+                        carpetas_destino[(materia, tipo)] = carpeta_destino
                     
-                    # Mover archivo
-                    try:
-                        shutil.move(str(archivo), str(ruta_destino))
-                        print(f"  ✓ {nombre_archivo} → {materia}/{tipo}/")
-                        archivos_organizados += 1
-                    except Exception as e:
-                        print(f"  ✗ Error moviendo {nombre_archivo}: {e}")
-                        archivos_no_organizados.append(nombre_archivo)
+                    # Construir ruta de destino; se mueve después, junto con el resto del lote
+                    ruta_destino = os.path.join(carpeta_destino, nombre_archivo)
+                    movimientos.append((archivo, ruta_destino))
+                    etiquetas.append((nombre_archivo, materia, tipo))
                 else:
                     # La materia fue identificada pero no tiene carpeta para este tipo
                     archivos_no_organizados.append(nombre_archivo)
-                    print(f"  ⚠ {nombre_archivo} no organizado ('{materia}' no tiene carpeta '{tipo}')")
+                    if detalle:
+                        lineas.append(f"  ⚠ {nombre_archivo} no organizado ('{materia}' no tiene carpeta '{tipo}')")
             else:
                 archivos_no_organizados.append(nombre_archivo)
-                motivo = []
-                if not materia:
-                    motivo.append("materia no identificada")
-                if not tipo:
-                    motivo.append("tipo de archivo no reconocido")
-                print(f"  ⚠ {nombre_archivo} no organizado ({', '.join(motivo)})")
+                if detalle:
+                    motivo = []
+                    if not materia:
+                        motivo.append("materia no identificada")
+                    if not tipo:
+                        motivo.append("tipo de archivo no reconocido")
+                    lineas.append(f"  ⚠ {nombre_archivo} no organizado ({', '.join(motivo)})")
+        
+        # Mover archivo
+        resultados = self._mover_en_lote(movimientos)
+        for (nombre_archivo, materia, tipo), (_, _, error) in zip(etiquetas, resultados):
+            if error is None:
+                if detalle:
+                    lineas.append(f"  ✓ {nombre_archivo} → {materia}/{tipo}/")
+                archivos_organizados += 1
+            else:
+                lineas.append(f"  ✗ Error moviendo {nombre_archivo}: {error}")
+                nivel = logging.ERROR
+                archivos_no_organizados.append(nombre_archivo)
+        if lineas:
+            logger.log(nivel, "\n".join(lineas))
         
         # Resumen
-        print(f"\n{'='*60}")
-        print(f"Resumen de organización:")
-        print(f"  Archivos organizados: {archivos_organizados}")
-        print(f"  Archivos sin organizar: {len(archivos_no_organizados)}")
-        
-        if archivos_no_organizados:
-            print(f"\nArchivos que no se pudieron organizar:")
-            for archivo in archivos_no_organizados:
-                print(f"  - {archivo}")
+        logger.info("\n%s", "=" * 60)
+        logger.info("Resumen de organización:")
+        logger.info("  Archivos organizados: %d", archivos_organizados)
+        logger.info("  Archivos sin organizar: %d", len(archivos_no_organizados))
+        
+        if archivos_no_organizados and detalle:
+            logger.info("\nArchivos que no se pudieron organizar:")
+            logger.info("\n".join(f"  - {archivo}" for archivo in archivos_no_organizados))
 
 
 def main():
-    # ===== CONFIGURACIÓN =====
-    # Cambia esta ruta a la carpeta donde tienes tus archivos
-    CARPETA_ORIGEN = "."  # "." significa la carpeta actual
-    
-    # Define tus materias con palabras clave para identificarlas
-    # Formato: "Nombre Materia": ["palabra1", "palabra2", "palabra3"]
-    MATERIAS_PALABRAS_CLAVE = {
-        "Base de Datos": [
-            "base", "datos", "basedatos", "bd", "postgresql", 
-            "postgres", "sql", "vistas", "auditoria", "modelo conceptual", 
-            "modelo", "actividad_clase", "BD"
-        ],
-        "Estructura de Datos": [
-            "tad", "pila", "cola", "colas", "arboles", "caratula", "ej", "EJ", "ver", "veterinaria"
-        ],
-        "Modelado Orientado a Objetos": [
-            "modelado", "objetos", "moo", "uml", "diagrama",
-            "secuencia", "clases", "argouml", "refactorizacion", 
-            "ejercicio", "escuela", "scar", "addons"
-        ],
-        "Perspectiva de la Inteligencia Artificial": [
-            "ia", "inteligencia", "artificial", "perspectiva",
-            "robotica", "vision", "sesgos", "discriminacion",
-            "etica", "responsabilidad", "logica difusa", "tendencias",
-            "trabajo-autonomo", "difusa", "ia", "Uleam"
-        ],
-        "Programacion Estructurada": [
-            "programacion", "estructurada", "funciones",
-            "ciclos", "diccionarios", "numpy", "archivos", "manipulacion", 
-            "actividad_en_clase", "actv", "hay q hacer", "ejercicio", "numeros", "multiplos", "escoger", "retorno",
-            "precios", "planificacion", "vector", "validar", "empleados", "promedio", "cedu","programacion"
-        ],
-        "Redes de la computadora": [
-            "redes", "red", "wan", "vpn", "ethernet", "fibra",
-            "optica", "packet tracer", "subnectic", "acls", "ieee","packet", "MAC"
-        ]
-    }
-    
-    # Define qué carpetas crear para cada materia
-    # Si no especificas una materia, usará la estructura por defecto: pdf, words, powerpoint
-    ESTRUCTURA_PERSONALIZADA = {
-        "Modelado Orientado a Objetos": [
-            "pdf", "words", "powerpoint", "imagenes", "diagramas"
-        ],
-        "Perspectiva de la Inteligencia Artificial": [
-            "pdf", "words", "powerpoint", "imagenes", "comprimidos"
-        ],
-        "Programacion Estructurada": [
-            "pdf", "words", "powerpoint","comprimidos", "codigo"
-        ],
-        "Estructura de Datos": [
-            "pdf", "words", "powerpoint", "codigos"
-        ],
-        "Redes de la computadora": [
-            "pdf", "words", "powerpoint"
-        ],
-        "Base de Datos": [
-            "pdf", "words", "powerpoint", "comprimidos"
-        ]
-        # Las demás materias usarán la estructura por defecto
-    }
-    # =========================
+    parser = argparse.ArgumentParser(description="Organiza archivos académicos por materia y tipo.")
+    parser.add_argument(
+        "-q", "--quiet", action="store_true",
+        help="no mostrar el detalle de cada archivo, solo avisos y errores"
+    )
+    args = parser.parse_args()
+    logging.basicConfig(
+        level=logging.WARNING if args.quiet else logging.INFO,
+        format="%(message)s",
+        stream=sys.stdout
+    )
     
     print("="*60)
     print("ORGANIZADOR DE ARCHIVOS ACADÉMICOS v2.0")
@@ -326,7 +684,7 @@ def main():
     )
     
     # Organizar archivos (mover de subcarpetas y organizar)
-    organizador.organizar_archivos(mover_de_subcarpetas=True, crear_estructura=True)
+    organizador.organizar_archivos(mover_de_subcarpetas=True)
     
     print("\n¡Organización completada!")
 